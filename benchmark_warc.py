@@ -16,17 +16,23 @@ Usage example (defaults mirror run_cluster.sh):
 from __future__ import annotations
 
 import argparse
+import atexit
+import csv
 import datetime
+import functools
 import os
-import platform
 import posixpath
-import random
+import select
 import shlex
 import shutil
+import socket
+import statistics
 import subprocess
 import sys
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from typing import Iterable, List, Sequence
 
@@ -43,8 +49,20 @@ DEFAULT_SSH_OPTIONS = [
     "StrictHostKeyChecking=accept-new",
     "-o",
     "ConnectTimeout=5",
+    # Multiplex successive ssh/scp invocations over one connection per host
+    "-o",
+    "ControlMaster=auto",
+    "-o",
+    f"ControlPath={os.path.expanduser('~/.ssh/cm-%r@%h:%p')}",
 ]
 
+# Upper bound on concurrent ssh processes spawned by SSHRunner.run_parallel
+MAX_SSH_FANOUT = 32
+# Reachability is checked by connecting to the ssh port, MAX_PROBE_FANOUT hosts at a time.
+# SSH_PORT is the fallback when `ssh -G` cannot resolve the configured port.
+SSH_PORT = 22
+MAX_PROBE_FANOUT = 32
+
 
 @dataclass
 class RunResult:
@@ -66,7 +84,20 @@ class RunResult:
         self.status = "ok"
         self.elapsed_seconds = elapsed
 
+    def to_csv_row(self) -> List[str]:
+        return [
+            str(self.machine_count),
+            str(self.run_iteration),
+            "" if self.map_max_lines is None else str(self.map_max_lines),
+            f"{self.elapsed_seconds:.3f}" if self.elapsed_seconds else "",
+            f"{self.speedup:.3f}" if self.speedup else "",
+            f"{self.serial_fraction:.3f}" if self.serial_fraction else "",
+            self.status,
+            "|".join(self.notes),
+        ]
+
 
+@functools.lru_cache(maxsize=None)
 def remote_path_expr(remote_root: str, name: str) -> str:
     combined = posixpath.join(remote_root, name)
     if combined.startswith("~"):
@@ -189,8 +220,8 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         "--ssh-args",
         default="",
         help=(
-            "Extra options appended to default SSH flags "
-            "(BatchMode=yes, StrictHostKeyChecking=accept-new, ConnectTimeout=5)"
+            "Extra options appended to default SSH flags (BatchMode=yes, "
+            "StrictHostKeyChecking=accept-new, ConnectTimeout=5, ControlMaster=auto)"
         ),
     )
     parser.add_argument(
@@ -212,6 +243,11 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         action="store_true",
         help="Show ssh command invocations and progress details",
     )
+    parser.add_argument(
+        "--use-clush",
+        action="store_true",
+        help="Fan out commands shared by every host through a single clush call (ClusterShell)",
+    )
     return parser.parse_args(argv)
 
 
@@ -281,67 +317,73 @@ def parse_map_lines_config(raw: str | None) -> dict[int, List[int]]:
     return mapping
 
 
-def is_host_reachable(host: str, timeout: float = 1.5) -> bool:
-    if not host:
-        return False
-    if shutil.which("ping") is None:
-        return True
-    system = platform.system().lower()
-    if system == "windows":
-        command = ["ping", "-n", "1", "-w", str(int(timeout * 1000)), host]
-    else:
-        command = ["ping", "-c", "1", "-W", str(int(timeout)), host]
+@functools.lru_cache(maxsize=None)
+def resolve_ssh_endpoint(host: str, ssh_args: tuple[str, ...] = ()) -> tuple[str, int]:
+    """Resolve the hostname and port ssh would connect to (-p, -o Port, ~/.ssh/config)."""
     try:
         completed = subprocess.run(
-            command,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            timeout=timeout + 1.0,
+            ["ssh", "-G", *ssh_args, host],
+            capture_output=True,
+            text=True,
             check=False,
         )
-        return completed.returncode == 0
-    except (subprocess.TimeoutExpired, OSError):
+    except OSError:
+        completed = None
+    hostname, port = host.rpartition("@")[2], SSH_PORT
+    if completed is not None and completed.returncode == 0:
+        for line in completed.stdout.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "hostname" and value:
+                hostname = value
+            elif key == "port" and value.isdigit():
+                port = int(value)
+    return hostname, port
+
+
+@functools.lru_cache(maxsize=None)
+def is_host_reachable(host: str, ssh_args: tuple[str, ...] = (), timeout: float = 1.5) -> bool:
+    """Probe the ssh port directly; results are cached for the lifetime of the process."""
+    if not host:
+        return False
+    try:
+        with socket.create_connection(resolve_ssh_endpoint(host, ssh_args), timeout=timeout):
+            return True
+    except OSError:
         return False
 
 
 def filter_reachable_hosts(
     hosts: Sequence[str],
     required: int | None = None,
+    ssh_args: Sequence[str] = (),
 ) -> tuple[List[str], List[str], List[str]]:
     hosts = list(hosts)
     if required is not None and required < 0:
         required = 0
-    ping_available = shutil.which("ping") is not None
     reachable: List[str] = []
     unreachable: List[str] = []
-    checked: List[str] = []
-
-    if not ping_available:
-        if required is None:
-            return hosts, [], []
-        reachable = hosts[:required]
-        untested = hosts[required:]
-        return reachable, [], untested
-
-    for host in hosts:
-        if required is not None and len(reachable) >= required:
-            break
-        checked.append(host)
-        if is_host_reachable(host):
-            reachable.append(host)
-        else:
-            unreachable.append(host)
-
-    if required is None:
-        # ping the full list
-        for host in hosts[len(checked) :]:
-            checked.append(host)
-            if is_host_reachable(host):
-                reachable.append(host)
+    checked = 0
+    ssh_args = tuple(ssh_args)
+
+    # Probe hosts in parallel waves, stopping as soon as enough of them answered
+    with ThreadPoolExecutor(max_workers=MAX_PROBE_FANOUT) as executor:
+        while checked < len(hosts):
+            if required is None:
+                batch = hosts[checked:]
             else:
-                unreachable.append(host)
+                missing = required - len(reachable)
+                if missing <= 0:
+                    break
+                batch = hosts[checked : checked + max(missing, MAX_PROBE_FANOUT)]
+            checked += len(batch)
+            probes = executor.map(lambda host: is_host_reachable(host, ssh_args), batch)
+            for host, alive in zip(batch, probes):
+                if alive:
+                    reachable.append(host)
+                else:
+                    unreachable.append(host)
 
-    untested = [host for host in hosts if host not in checked]
+    untested = hosts[checked:]
     return reachable, unreachable, untested
 
 
@@ -351,11 +393,8 @@ def generate_warc_paths(
     template: str,
     offset: int,
 ) -> List[str]:
-    warc_paths: List[str] = []
-    for i in range(total):
-        filename = template.format(index=i + offset)
-        warc_paths.append(posixpath.join(warc_dir, filename))
-    return warc_paths
+    prefix = warc_dir if not warc_dir or warc_dir.endswith("/") else f"{warc_dir}/"
+    return [prefix + template.format(index=i + offset) for i in range(total)]
 
 
 def build_worker_layout(pool: Sequence[str], machine_count: int, total_workers: int) -> List[str]:
@@ -378,19 +417,32 @@ class SSHRunner:
         user: str | None = None,
         dry_run: bool = False,
         verbose: bool = False,
+        use_clush: bool = False,
     ) -> None:
         self.extra_args = list(extra_args)
         self.user = user
         self.dry_run = dry_run
         self.verbose = verbose
+        self.use_clush = use_clush
+        self._print_lock = threading.Lock()
+        self._contacted_hosts: set[str] = set()
+        self._ssh_prefixes: dict[str, tuple[str, ...]] = {}
+        atexit.register(self.close)
 
-    def _format_host(self, host: str) -> str:
+    def format_host(self, host: str) -> str:
         if "@" in host:
             return host
         if self.user:
             return f"{self.user}@{host}"
         return host
 
+    def _ssh_prefix(self, host: str) -> tuple[str, ...]:
+        prefix = self._ssh_prefixes.get(host)
+        if prefix is None:
+            prefix = ("ssh", self.format_host(host), *self.extra_args)
+            self._ssh_prefixes[host] = prefix
+        return prefix
+
     def run(
         self,
         host: str,
@@ -400,14 +452,16 @@ class SSHRunner:
         capture: bool = False,
         log: bool | None = None,
     ) -> subprocess.CompletedProcess[str]:
-        target = self._format_host(host)
-        ssh_cmd = ["ssh", target, *self.extra_args, command]
+        prefix = self._ssh_prefix(host)
+        ssh_cmd = [*prefix, command]
+        self._contacted_hosts.add(prefix[1])
         if log is None:
             should_log = self.dry_run or self.verbose
         else:
             should_log = log or self.dry_run
         if should_log:
-            print(f"[ssh] {' '.join(shlex.quote(part) for part in ssh_cmd)}")
+            with self._print_lock:
+                print(f"[ssh] {' '.join(shlex.quote(part) for part in ssh_cmd)}")
         if self.dry_run:
             return subprocess.CompletedProcess(ssh_cmd, 0, "", "")
         return subprocess.run(
@@ -417,6 +471,132 @@ class SSHRunner:
             capture_output=capture,
         )
 
+    def run_stream(self, host: str, command: str, match: str, timeout: float) -> bool:
+        """Stream the command output and return True as soon as `match` appears in it."""
+        prefix = self._ssh_prefix(host)
+        ssh_cmd = [*prefix, command]
+        self._contacted_hosts.add(prefix[1])
+        if self.dry_run or self.verbose:
+            with self._print_lock:
+                print(f"[ssh] {' '.join(shlex.quote(part) for part in ssh_cmd)}")
+        if self.dry_run:
+            return True
+        needle = match.encode()
+        deadline = time.monotonic() + timeout
+        with subprocess.Popen(
+            ssh_cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        ) as proc:
+            assert proc.stdout is not None
+            fd = proc.stdout.fileno()
+            pending = b""
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    ready, _, _ = select.select([fd], [], [], remaining)
+                    if not ready:
+                        return False
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        return False
+                    pending += chunk
+                    if needle in pending:
+                        return True
+                    # Keep just enough bytes to match a sentinel split across reads
+                    pending = pending[-len(needle):]
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+
+    def close(self) -> None:
+        """Tear down the ControlMaster connections opened by previous runs."""
+        if self.dry_run:
+            return
+        hosts = sorted(self._contacted_hosts)
+        self._contacted_hosts.clear()
+        for target in hosts:
+            subprocess.run(
+                ["ssh", *self.extra_args, "-O", "exit", target],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+
+    def open_connections(self, hosts: Iterable[str]) -> None:
+        """Start a background ControlMaster per host so later calls skip the handshake."""
+        targets = sorted({self.format_host(host) for host in hosts})
+        if self.dry_run or not targets:
+            return
+        self._contacted_hosts.update(targets)
+        with ThreadPoolExecutor(max_workers=min(MAX_SSH_FANOUT, len(targets))) as executor:
+            for target in targets:
+                executor.submit(
+                    subprocess.run,
+                    ["ssh", "-f", "-N", *self.extra_args, target],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
+                )
+
+    def run_everywhere(self, hosts: Iterable[str], command: str, *, check: bool = True) -> bool:
+        """Run the same command on every host, through one clush call when enabled."""
+        # Deduplicate on the full user@host target so explicit users are kept
+        targets = sorted({self.format_host(host) for host in hosts})
+        if not targets:
+            return True
+        if not self.use_clush:
+            errors = self.run_parallel([(target, command) for target in targets], check=check)
+            return all(error is None for error in errors)
+        # clush takes the login separately (-l), so issue one call per distinct user
+        nodes_by_user: dict[str | None, List[str]] = {}
+        for target in targets:
+            user, _, node = target.rpartition("@")
+            nodes_by_user.setdefault(user or None, []).append(node)
+        success = True
+        for user, nodes in nodes_by_user.items():
+            clush_cmd = ["clush", "-b", "-w", ",".join(nodes)]
+            if user:
+                clush_cmd.extend(["-l", user])
+            if self.extra_args:
+                clush_cmd.extend(["-o", " ".join(shlex.quote(arg) for arg in self.extra_args)])
+            clush_cmd.append(command)
+            if self.dry_run or self.verbose:
+                with self._print_lock:
+                    print(f"[clush] {' '.join(shlex.quote(part) for part in clush_cmd)}")
+            if self.dry_run:
+                continue
+            completed = subprocess.run(clush_cmd, text=True, check=check)
+            success = success and completed.returncode == 0
+        return success
+
+    def run_parallel(
+        self,
+        commands: Sequence[tuple[str, str]],
+        *,
+        check: bool = True,
+    ) -> List[subprocess.CalledProcessError | None]:
+        """Run (host, command) pairs concurrently, returning per-pair errors in input order."""
+        errors: List[subprocess.CalledProcessError | None] = [None] * len(commands)
+        if not commands:
+            return errors
+        max_workers = min(MAX_SSH_FANOUT, len(commands))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.run, host, command, check=check): position
+                for position, (host, command) in enumerate(commands)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except subprocess.CalledProcessError as exc:
+                    errors[futures[future]] = exc
+        return errors
+
 
 def quotecmd(parts: Iterable[str]) -> str:
     return shlex.join(list(parts))
@@ -429,25 +609,45 @@ def build_remote_launcher(
     extra_args: Sequence[str],
     log_path: str,
 ) -> str:
+    return build_remote_batch_launcher(
+        python_bin,
+        remote_root,
+        script_name,
+        [(shlex.join(extra_args), log_path)],
+    )
+
+
+def build_remote_batch_launcher(
+    python_bin: str,
+    remote_root: str,
+    script_name: str,
+    launches: Sequence[tuple[str, str]],
+) -> str:
+    """Build one remote command backgrounding every (quoted_args, log_path) launch.
+
+    Arguments must already be shell-quoted, so callers can escape the parts shared
+    by every worker once per run instead of once per launch.
+    """
     script_expr = remote_path_expr(remote_root, script_name)
-    log_expr = remote_path_expr(remote_root, log_path)
-    args_str = " ".join(shlex.quote(arg) for arg in extra_args)
     python_expr = shlex.quote(python_bin)
-    launch = f"nohup {python_expr} {script_expr}"
-    if args_str:
-        launch += f" {args_str}"
-    launch += f" > {log_expr} 2>&1 &"
-    return f"bash -lc {shlex.quote(launch)}"
+    fragments: List[str] = []
+    command_prefix = f"nohup {python_expr} {script_expr}"
+    for quoted_args, log_path in launches:
+        log_expr = remote_path_expr(remote_root, log_path)
+        if quoted_args:
+            command = f"{command_prefix} {quoted_args}"
+        else:
+            command = command_prefix
+        fragments.append(f"{command} > {log_expr} 2>&1 &")
+    return f"bash -lc {shlex.quote(' '.join(fragments))}"
 
 
 def sync_remote_code(
+    runner: SSHRunner,
     hosts: Iterable[str],
     *,
-    user: str | None,
     remote_root: str,
     ssh_options: Sequence[str],
-    dry_run: bool,
-    verbose: bool,
 ) -> None:
     unique_hosts = sorted({host.split("@")[-1] for host in hosts})
     if not unique_hosts:
@@ -456,31 +656,55 @@ def sync_remote_code(
     if not remote_dir.endswith("/"):
         remote_dir = f"{remote_dir}/"
     files_to_copy = ["serveur.py", "client.py"]
-    # All hosts are expected to have the same remote_root structure (NFS : Network File System)
-    # Take a random host to display the scp command, real random selection is needed
-    host = random.choice(unique_hosts)
-    target = host if user is None or "@" in host else f"{user}@{host}"
-    for local_path in files_to_copy:
-        scp_cmd = ["scp", *ssh_options, local_path, f"{target}:{remote_dir}"]
-        if dry_run or verbose:
-            print(f"[scp] {' '.join(shlex.quote(part) for part in scp_cmd)}")
-        if dry_run:
-            continue
-        subprocess.run(scp_cmd, check=True)
+
+    # Hosts whose remote_root resolves to the same NFS directory only need one copy.
+    # The filesystem id (stat -f %i) tells apart exports whose roots share an inode.
+    root_expr = remote_path_expr(remote_root, "")
+    probe = f"stat -f -c %i,%T {root_expr} && stat -c %i {root_expr}"
+    probe_cmd = f"bash -lc {shlex.quote(probe)}"
+    with ThreadPoolExecutor(max_workers=min(MAX_SSH_FANOUT, len(unique_hosts))) as executor:
+        probes = list(
+            executor.map(
+                lambda host: runner.run(host, probe_cmd, check=False, capture=True, log=False),
+                unique_hosts,
+            )
+        )
+    targets_by_fs: dict[str, str] = {}
+    for host, probe in zip(unique_hosts, probes):
+        fs_info, _, inode = probe.stdout.strip().partition("\n")
+        fsid, _, fs_type = fs_info.partition(",")
+        if probe.returncode == 0 and fs_type.startswith("nfs") and fsid and inode:
+            key = f"{fs_type}:{fsid}:{inode}"
+        else:
+            key = host
+        targets_by_fs.setdefault(key, host)
+
+    if shutil.which("rsync") is not None:
+        ssh_expr = " ".join(shlex.quote(part) for part in ["ssh", *ssh_options])
+        base_cmd = ["rsync", "-az", "-e", ssh_expr, *files_to_copy]
+    else:
+        base_cmd = ["scp", *ssh_options, *files_to_copy]
+    copy_cmds = [
+        [*base_cmd, f"{runner.format_host(host)}:{remote_dir}"]
+        for host in targets_by_fs.values()
+    ]
+    for copy_cmd in copy_cmds:
+        if runner.dry_run or runner.verbose:
+            print(f"[{copy_cmd[0]}] {' '.join(shlex.quote(part) for part in copy_cmd)}")
+    if runner.dry_run:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_SSH_FANOUT, len(copy_cmds))) as executor:
+        futures = [executor.submit(subprocess.run, cmd, check=True) for cmd in copy_cmds]
+        for future in as_completed(futures):
+            future.result()
 
 
 def kill_remote_processes(runner: SSHRunner, hosts: Iterable[str]) -> None:
-    unique_hosts = sorted(set(hosts))
-    for host in unique_hosts:
-        try:
-            runner.run(
-                host,
-                "bash -lc 'pkill -f \"python3.*serveur.py\" 2>/dev/null || true; "
-                "pkill -f \"python3.*client.py\" 2>/dev/null || true'",
-                check=False,
-            )
-        except subprocess.CalledProcessError:
-            pass
+    command = (
+        "bash -lc 'pkill -f \"python3.*serveur.py\" 2>/dev/null || true; "
+        "pkill -f \"python3.*client.py\" 2>/dev/null || true'"
+    )
+    runner.run_everywhere(hosts, command, check=False)
 
 
 def wait_for_completion(
@@ -489,20 +713,16 @@ def wait_for_completion(
     worker_hosts: Sequence[str],
     timeout: int,
     remote_root: str,
-    poll_interval: float = 2.0,
 ) -> bool:
     master_log_expr = remote_path_expr(remote_root, "mapreduce_master.log")
-    start = time.monotonic()
-    while time.monotonic() - start < timeout:
-        sentinel_cmd = (
-            "bash -lc "
-            f"\"test -f {master_log_expr} && grep -q 'Final wordcount' {master_log_expr}\""
-        )
-        sentinel_result = runner.run(master, sentinel_cmd, check=False, log=False)
-        if sentinel_result.returncode == 0:
-            return True
-        time.sleep(poll_interval)
-    return False
+    # A single ssh session blocks on `tail -F` until the sentinel line shows up,
+    # then stops tail so the session returns without waiting for more output.
+    follow = (
+        f"timeout {int(timeout)} tail -n +1 -F {master_log_expr} 2>/dev/null </dev/null | "
+        "{ grep -m1 'Final wordcount' && pkill -P $$ -x timeout; }"
+    )
+    sentinel_cmd = f"bash -lc {shlex.quote(follow)}"
+    return runner.run_stream(master, sentinel_cmd, "Final wordcount", timeout + 5)
 
 
 def compute_speedups(results: List[RunResult]) -> None:
@@ -516,10 +736,12 @@ def compute_speedups(results: List[RunResult]) -> None:
         ]
         if not ok_results:
             continue
-        baseline_result = min(
-            ok_results, key=lambda res: (res.machine_count, res.elapsed_seconds)
+        # Median over the repetitions of the smallest machine count, so a single
+        # lucky (or unlucky) baseline run does not skew every speedup of the group
+        min_count = min(res.machine_count for res in ok_results)
+        baseline = statistics.median(
+            res.elapsed_seconds for res in ok_results if res.machine_count == min_count
         )
-        baseline = baseline_result.elapsed_seconds
         if not baseline:
             continue
         serial_estimates: List[float] = []
@@ -535,41 +757,44 @@ def compute_speedups(results: List[RunResult]) -> None:
                     result.serial_fraction = serial
                     serial_estimates.append(serial)
         if serial_estimates:
-            avg_serial = sum(serial_estimates) / len(serial_estimates)
+            avg_serial = statistics.fmean(serial_estimates)
             for result in ok_results:
-                predicted = 1.0 / (
-                    avg_serial + (1.0 - avg_serial) / result.machine_count
-                )
+                n = result.machine_count
+                predicted = 1.0 / (avg_serial + (1.0 - avg_serial) / n)
                 note = (
                     f"Predicted speedup (Amdahl, f={avg_serial:.3f}): "
                     f"{predicted:.3f}"
                 )
                 result.notes.append(note)
+                # Gustafson: scaled speedup when the workload grows with the machine count
+                scaled = n - avg_serial * (n - 1)
+                note = (
+                    f"Predicted scaled speedup (Gustafson, f={avg_serial:.3f}): "
+                    f"{scaled:.3f}"
+                )
+                result.notes.append(note)
+
+
+CSV_HEADER = [
+    "machine_count",
+    "run_iteration",
+    "map_max_lines",
+    "elapsed_seconds",
+    "speedup",
+    "serial_fraction",
+    "status",
+    "notes",
+]
 
 
 def write_csv(results: List[RunResult], path: str) -> None:
-    header = (
-        "machine_count,run_iteration,map_max_lines,"
-        "elapsed_seconds,speedup,serial_fraction,status,notes\n"
-    )
-    line_parts = []
     file_exists = os.path.exists(path)
-    with open(path, "a", encoding="ascii") as handle:
+    with open(path, "a", encoding="ascii", newline="") as handle:
+        # Single quotes keep the files readable by amdahl_analysis.ipynb (quotechar="'")
+        writer = csv.writer(handle, quotechar="'", lineterminator="\n")
         if not file_exists:
-            handle.write(header)
-        for result in results:
-            notes = "|".join(result.notes)
-            line_parts = [
-                str(result.machine_count),
-                str(result.run_iteration),
-                str(result.map_max_lines) if result.map_max_lines is not None else "",
-                f"{result.elapsed_seconds:.3f}" if result.elapsed_seconds else "",
-                f"{result.speedup:.3f}" if result.speedup else "",
-                f"{result.serial_fraction:.3f}" if result.serial_fraction else "",
-                result.status,
-                shlex.quote(notes),
-            ]
-            handle.write(",".join(line_parts) + "\n")
+            writer.writerow(CSV_HEADER)
+        writer.writerows(result.to_csv_row() for result in results)
 
 
 def launch_benchmark(args: argparse.Namespace) -> List[RunResult]:
@@ -586,9 +811,16 @@ def launch_benchmark(args: argparse.Namespace) -> List[RunResult]:
     host_pool = parse_csv_list(args.host_pool)
     machine_counts = [int(value) for value in parse_csv_list(args.machine_counts)]
     max_required_hosts = max(machine_counts) if machine_counts else 1
+    # Keep multiplexed connections alive across a whole run, idle workers included
+    extra_args = [*DEFAULT_SSH_OPTIONS, "-o", f"ControlPersist={args.timeout + 60}s"]
+    if args.ssh_key:
+        extra_args.extend(["-i", args.ssh_key])
+    if args.ssh_args:
+        extra_args.extend(shlex.split(args.ssh_args))
     reachable_hosts, unreachable_hosts, untested_hosts = filter_reachable_hosts(
         host_pool,
         required=max_required_hosts,
+        ssh_args=extra_args,
     )
     if unreachable_hosts:
         print(
@@ -605,9 +837,11 @@ def launch_benchmark(args: argparse.Namespace) -> List[RunResult]:
     checked_set = set(reachable_hosts + unreachable_hosts)
     remaining_hosts = [host for host in host_pool if host not in checked_set]
     host_pool = reachable_hosts + remaining_hosts
-    if not is_host_reachable(args.master):
+    if not is_host_reachable(args.master, tuple(extra_args)):
+        master_port = resolve_ssh_endpoint(args.master, tuple(extra_args))[1]
         print(
-            f"[host-check] Warning: master host {args.master} did not respond to ping.",
+            f"[host-check] Warning: master host {args.master} did not accept a connection "
+            f"on port {master_port}.",
             file=sys.stderr,
         )
     warc_paths = generate_warc_paths(
@@ -616,28 +850,27 @@ def launch_benchmark(args: argparse.Namespace) -> List[RunResult]:
         args.warc_template,
         args.warc_offset,
     )
-    extra_args = list(DEFAULT_SSH_OPTIONS)
-    if args.ssh_key:
-        extra_args.extend(["-i", args.ssh_key])
-    if args.ssh_args:
-        extra_args.extend(shlex.split(args.ssh_args))
+    quoted_warc_paths = [shlex.quote(path) for path in warc_paths]
+    use_clush = args.use_clush and shutil.which("clush") is not None
+    if args.use_clush and not use_clush:
+        print("[clush] clush not found in PATH, falling back to ssh fan-out", file=sys.stderr)
     runner = SSHRunner(
         extra_args=extra_args,
         user=args.ssh_user,
         dry_run=args.dry_run,
         verbose=args.verbose,
+        use_clush=use_clush,
     )
+    runner.open_connections([args.master, *host_pool[:max_required_hosts]])
 
-    all_hosts_for_sync = [args.master, *host_pool]
+    all_hosts_for_sync = [args.master, *host_pool[:max_required_hosts]]
     if not args.skip_sync:
         try:
             sync_remote_code(
+                runner,
                 all_hosts_for_sync,
-                user=args.ssh_user,
                 remote_root=args.remote_root,
                 ssh_options=extra_args,
-                dry_run=args.dry_run,
-                verbose=args.verbose,
             )
         except subprocess.CalledProcessError as exc:
             print(f"Failed to sync code to remote hosts: {exc}", file=sys.stderr)
@@ -716,35 +949,49 @@ def launch_benchmark(args: argparse.Namespace) -> List[RunResult]:
                 if args.sleep_after_master:
                     time.sleep(args.sleep_after_master)
 
-                host_args = layout
-                worker_failures = False
-                for index, host in enumerate(layout, start=1):
-                    extra = [
-                        str(index),
-                        *host_args,
+                # Quote the arguments shared by every worker once for this run
+                shared_args = shlex.join(
+                    [
+                        *layout,
                         "--master-host",
                         args.master,
                         "--control-port",
                         str(args.control_port),
                         "--shuffle-port-base",
                         str(args.shuffle_port_base),
-                        "--split-id",
-                        warc_paths[index - 1],
                     ]
-                    if line_limit is not None:
-                        extra.extend(["--max-lines", str(line_limit)])
-                    worker_cmd = build_remote_launcher(
+                )
+                limit_args = f" --max-lines {line_limit}" if line_limit is not None else ""
+                # Group worker launches per host so each machine gets a single ssh call
+                launches_by_host: dict[str, List[tuple[int, str]]] = {}
+                for index, host in enumerate(layout, start=1):
+                    quoted_args = (
+                        f"{index} {shared_args} --split-id {quoted_warc_paths[index - 1]}"
+                        f"{limit_args}"
+                    )
+                    launches_by_host.setdefault(host, []).append((index, quoted_args))
+
+                worker_commands: List[tuple[str, str]] = []
+                for host, launches in launches_by_host.items():
+                    worker_cmd = build_remote_batch_launcher(
                         args.remote_python,
                         args.remote_root,
                         "client.py",
-                        extra,
-                        f"mapreduce_worker_{index}.log",
+                        [
+                            (quoted_args, f"mapreduce_worker_{index}.log")
+                            for index, quoted_args in launches
+                        ],
                     )
-                    try:
-                        runner.run(host, worker_cmd)
-                    except subprocess.CalledProcessError as exc:
-                        worker_failures = True
-                        result.notes.append(f"Worker {index} launch failed on {host}: {exc}")
+                    worker_commands.append((host, worker_cmd))
+
+                worker_failures = False
+                launch_errors = runner.run_parallel(worker_commands)
+                for (host, launches), error in zip(launches_by_host.items(), launch_errors):
+                    if error is None:
+                        continue
+                    worker_failures = True
+                    for index, _ in launches:
+                        result.notes.append(f"Worker {index} launch failed on {host}: {error}")
 
                 if worker_failures:
                     result.record_failure("One or more workers failed to launch")
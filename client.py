@@ -3,16 +3,31 @@ from __future__ import annotations
 import argparse
 import collections
 import hashlib
+import itertools
 import json
+import mmap
+import os
 import re
+import selectors
 import socket
 import struct
 import sys
 import threading
 import time
 import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import xxhash
+except ImportError:  # dépendance optionnelle, seulement pour --hash xxh3
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:  # dépendance optionnelle : repli sur le module json standard
+    orjson = None
 
 """Worker client for the distributed MapReduce wordcount demo.
 
@@ -24,6 +39,78 @@ dédié et sont cumulés pour la réduction locale.
 """
 
 WORD_RE = re.compile(r"\w+")
+# Variante ASCII appliquée directement aux octets du split (--ascii-words) :
+# ni décodage ni lower() Unicode, mais les lettres accentuées deviennent des séparateurs.
+ASCII_WORD_RE = re.compile(rb"[a-z0-9_]+")
+# Nombre de lignes du split tokenisées d'un coup pendant la phase map.
+MAP_LINES_PER_BLOCK = 8192
+# Octets accumulés par destination avant un envoi. Les trames sont recopiées
+# dans un seul bytearray plutôt que passées en liste à sendmsg() : avec des
+# mots de quelques octets, un lot dépasserait vite IOV_MAX (1024 segments).
+DEFAULT_FLUSH_THRESHOLD = 256 * 1024
+# Connexion aux pairs : délai de la première relance (doublé à chaque échec)
+# et durée totale au-delà de laquelle on abandonne.
+CONNECT_RETRY_DELAY = 0.01
+CONNECT_RETRY_BUDGET = 5.0
+# Taille des tampons noyau des sockets shuffle (le défaut ~64 Ko limite le débit).
+SOCKET_BUFFER_SIZE = 1 << 20
+# Préfixe de taille des messages de contrôle (4 octets big-endian).
+LENGTH_PREFIX = struct.Struct(">I")
+# En-tête d'une trame shuffle : taille du mot puis nombre d'occurrences (64 bits,
+# un split combiné pouvant dépasser 2**32 occurrences d'un même mot).
+FRAME_HEADER = struct.Struct(">IQ")
+# Enregistrement binaire d'un résultat reduce envoyé au master : taille du mot
+# (UTF-8) puis nombre d'occurrences, suivis du mot.
+RESULT_RECORD = struct.Struct(">IQ")
+# Trame vide (taille 0, compte 0) signalant qu'un pair a terminé sa phase map.
+END_OF_MAP_FRAME = FRAME_HEADER.pack(0, 0)
+# Délai max d'attente des fins de flux des autres workers avant la réduction.
+SHUFFLE_DRAIN_TIMEOUT = 60.0
+# Tampon de réception réutilisé par chaque flux shuffle entrant.
+SHUFFLE_RECV_BUFFER_SIZE = 64 * 1024
+# Octets lus d'un coup par les processus de la phase map parallèle.
+MAP_BLOCK_SIZE = 1 << 20
+
+
+# Compte les mots de la tranche [start, end) du split. Exécutée dans un
+# processus fils (--map-processes) : les bornes tombent sur des fins de ligne.
+# En mode ASCII, les clés du Counter renvoyé sont des bytes.
+def count_words_in_range(
+    path: str, start: int, end: int, encoding: str, ascii_words: bool = False
+) -> collections.Counter:
+    counts: collections.Counter = collections.Counter()
+    # Le fichier est projeté en mémoire : les processus fils partagent le même
+    # cache de pages et le découpage en blocs se fait sans readline().
+    with open(path, "rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        if hasattr(mapped, "madvise"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        position = start
+        while position < end:
+            stop = min(position + MAP_BLOCK_SIZE, end)
+            # Prolonger le bloc jusqu'à la fin de ligne pour ne pas scinder un mot.
+            if stop < end:
+                newline = mapped.find(b"\n", stop - 1, end)
+                stop = end if newline < 0 else newline + 1
+            block = mapped[position:stop]
+            position = stop
+            if ascii_words:
+                counts.update(ASCII_WORD_RE.findall(block.lower()))
+            else:
+                counts.update(WORD_RE.findall(block.decode(encoding).lower()))
+    return counts
+
+
+# État d'un flux shuffle entrant : tampon de réception réutilisé et comptes reçus.
+class ShuffleStream:
+    __slots__ = ("buffer", "view", "filled", "counts")
+
+    def __init__(self) -> None:
+        self.buffer = bytearray(SHUFFLE_RECV_BUFFER_SIZE)
+        self.view = memoryview(self.buffer)
+        self.filled = 0
+        self.counts: Dict[str, int] = {}
 
 
 class MapReduceClient:
@@ -39,7 +126,9 @@ class MapReduceClient:
         encoding: str,
         max_lines: Optional[int],
         hash_name: str = "crc32",
-        flush_threshold: int = 64 * 1024,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+        map_processes: int = 1,
+        ascii_words: bool = False,
     ) -> None:
         self.machine_index = machine_index
         self.worker_id = worker_id
@@ -52,13 +141,27 @@ class MapReduceClient:
         self.encoding = encoding
         self.max_lines = max_lines
         self._hash_name = hash_name.lower()
+        self._hash_bytes = self._select_hash_function(self._hash_name)
 
         self._incoming_counts = collections.Counter()
         self._incoming_lock = threading.Lock()
+        # Signalé à chaque fin de flux d'un pair ; la réduction attend tous les pairs.
+        self._incoming_condition = threading.Condition(self._incoming_lock)
+        self._finished_peers = 0
+        # Un dict de comptes par flux entrant, rempli sans verrou par son thread
+        # et fusionné seulement à la réduction ; le verrou ne protège que la liste.
+        # Des dict simples plutôt que des Counter : chaque mot reçu est une clé
+        # nouvelle, et Counter.__missing__ coûterait un appel Python par mot.
+        self._shard_counters: List[Dict[str, int]] = []
+        # Compteur propre au thread map pour les mots dont on est propriétaire :
+        # pas de verrou par mot, fusion unique à la fin de la phase map.
+        self._local_counts: Dict[str, int] = {}
         self._shutdown_event = threading.Event()
         self._outgoing_sockets: Dict[int, socket.socket] = {}
-        self._pending_frames: Dict[int, bytearray] = {}
         self._flush_threshold = max(0, flush_threshold)
+        self._map_processes = max(1, map_processes)
+        self._ascii_words = ascii_words
+        self._listener_socket: Optional[socket.socket] = None
         self._listener_thread: Optional[threading.Thread] = None
         self._master_socket: Optional[socket.socket] = None
 
@@ -75,43 +178,90 @@ class MapReduceClient:
             self._close_outgoing()
             if self._master_socket is not None:
                 self._master_socket.close()
-            self._poke_listener()
+            self._stop_shuffle_listener()
 
     # Démarre le thread d'écoute pour la phase shuffle.
     def _start_shuffle_listener(self) -> None:
-        # Thread d'écoute asynchrone pour recevoir les paires (mot, 1)
-        # qui nous sont destinées pendant la phase map des autres workers.
-        def run_listener() -> None:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_sock:
-                server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                server_sock.bind(("0.0.0.0", self.shuffle_port))
-                server_sock.listen()
-                server_sock.settimeout(1.0)
-                while not self._shutdown_event.is_set():
-                    try:
-                        conn, _ = server_sock.accept()
-                    except socket.timeout:
-                        continue
-                    conn.settimeout(1.0)
-                    threading.Thread(
-                        target=self._consume_shuffle_stream,
-                        args=(conn,),
-                        daemon=True,
-                    ).start()
-
-        self._listener_thread = threading.Thread(target=run_listener, daemon=True)
+        # Une seule socket d'écoute, sans SO_REUSEPORT : un worker resté d'un run
+        # précédent ferait échouer bind() (EADDRINUSE) au lieu de se partager
+        # silencieusement les connexions des pairs.
+        # Elle est liée ici, avant l'inscription auprès du master, pour que les
+        # pairs ne puissent pas se connecter avant que le port soit ouvert.
+        server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Réglé avant listen() pour que les sockets acceptés en héritent.
+        server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        server_sock.bind(("0.0.0.0", self.shuffle_port))
+        server_sock.listen()
+        self._listener_socket = server_sock
+        self._listener_thread = threading.Thread(
+            target=self._serve_shuffle_connections, args=(server_sock,), daemon=True
+        )
         self._listener_thread.start()
 
-    # Force la terminaison du thread d'écoute.
-    def _poke_listener(self) -> None:
-        # Force accept() à sortir pour que le thread se termine proprement.
+    # Boucle événementielle d'une socket d'écoute : un seul thread accepte les
+    # pairs et draine toutes leurs connexions via epoll, au lieu d'un thread
+    # par connexion. Elle reçoit les paires (mot, nombre) qui nous sont
+    # destinées pendant la phase map des autres workers.
+    def _serve_shuffle_connections(self, server_sock: socket.socket) -> None:
+        with selectors.DefaultSelector() as selector:
+            server_sock.setblocking(False)
+            selector.register(server_sock, selectors.EVENT_READ)
+            try:
+                while not self._shutdown_event.is_set():
+                    for key, _ in selector.select():
+                        if key.data is None:
+                            if not self._accept_shuffle_connection(server_sock, selector):
+                                return
+                            continue
+                        finished = self._drain_shuffle_stream(key.fileobj, key.data)
+                        if finished is None:
+                            continue
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                        if finished:
+                            with self._incoming_condition:
+                                self._finished_peers += 1
+                                self._incoming_condition.notify_all()
+            finally:
+                for key in list(selector.get_map().values()):
+                    if key.data is not None:
+                        key.fileobj.close()
+
+    # Accepte un pair et enregistre sa connexion ; False si la socket d'écoute est fermée.
+    def _accept_shuffle_connection(
+        self, server_sock: socket.socket, selector: selectors.BaseSelector
+    ) -> bool:
         try:
-            with socket.create_connection(("127.0.0.1", self.shuffle_port), timeout=0.5):
-                pass
+            conn, _ = server_sock.accept()
+        except BlockingIOError:
+            return True
         except OSError:
-            pass
+            return False
+        conn.setblocking(False)
+        # Linux uniquement : acquitte sans attendre le délai d'ACK retardé.
+        if hasattr(socket, "TCP_QUICKACK"):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        stream = ShuffleStream()
+        # Chaque flux compte dans son propre dict, enregistré une seule fois
+        # et fusionné à la réduction : aucun verrou n'est pris par mot.
+        with self._incoming_lock:
+            self._shard_counters.append(stream.counts)
+        selector.register(conn, selectors.EVENT_READ, stream)
+        return True
+
+    # Arrête le thread d'écoute : shutdown() réveille la boucle d'acceptation.
+    def _stop_shuffle_listener(self) -> None:
+        if self._listener_socket is not None:
+            try:
+                self._listener_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener_socket.close()
+            self._listener_socket = None
         if self._listener_thread is not None:
             self._listener_thread.join(timeout=1.0)
+            self._listener_thread = None
 
     # Connexion au master et enregistrement
     def _connect_master(self) -> None:
@@ -150,11 +300,14 @@ class MapReduceClient:
                     "machine_index": self.worker_id,
                     "success": error is None,
                 }
-                if results is not None:
-                    payload["results"] = results
+                # Les résultats suivent le message JSON sous forme binaire ;
+                # le message n'en annonce que la taille en octets.
+                blob = self._encode_results(results) if results is not None else None
+                if blob is not None:
+                    payload["results_size"] = len(blob)
                 if error is not None:
                     payload["error"] = error
-                self._send_control(payload)
+                self._send_control(payload, blob or b"")
             elif msg_type == "shutdown":
                 break
             else:
@@ -166,10 +319,6 @@ class MapReduceClient:
     # Lit le split local et envoie les mots aux autres workers.
     def _run_map_stage(self) -> Tuple[bool, Optional[str]]:
         try:
-            # Vider d'abord les accumulations pour ne pas mélanger deux jobs.
-            with self._incoming_lock:
-                self._incoming_counts.clear()
-            
             # If split_id contains a path separator, use it as-is, otherwise use split_X.txt format
             if "/" in self.split_id:
                 path = Path(self.split_id)
@@ -178,175 +327,377 @@ class MapReduceClient:
             
             if not path.exists():
                 raise FileNotFoundError(f"split file missing: {path}")
-            for word in self._iter_words(path):
-                destination = self._hash_to_index(word)
-                self._send_word(destination, word)
+            # Combiner : on agrège le split (ou chaque tranche avec
+            # --map-processes) avant le shuffle pour n'envoyer qu'une trame
+            # (mot, nombre) par mot distinct.
+            for combined in self._iter_word_counts(path):
+                self._partition_counts(combined)
             return True, None
         except Exception as exc:  # pylint: disable=broad-except
             return False, str(exc)
         finally:
-            self._flush_all_outgoing()
+            self._send_end_of_map()
             self._close_outgoing()
+            with self._incoming_lock:
+                self._incoming_counts.update(self._local_counts)
+            self._local_counts.clear()
 
     # Réduit les paires (mot, count) accumulées localement.
     def _run_reduce_stage(self) -> Tuple[Optional[List[Tuple[str, int]]], Optional[str]]:
         try:
-            with self._incoming_lock:
-                snapshot = list(self._incoming_counts.items())
+            expected_peers = len(self.hosts) - 1
+            with self._incoming_condition:
+                # Les trames d'un pair peuvent encore être en vol quand le master
+                # lance la réduction : on attend la fin de flux de chacun d'eux.
+                drained = self._incoming_condition.wait_for(
+                    lambda: self._finished_peers >= expected_peers,
+                    timeout=SHUFFLE_DRAIN_TIMEOUT,
+                )
+                if not drained:
+                    raise TimeoutError(
+                        f"shuffle incomplete: {self._finished_peers}/{expected_peers} "
+                        "peers finished sending"
+                    )
+                merged = self._incoming_counts
+                for shard in self._shard_counters:
+                    merged.update(shard)
+                snapshot = list(merged.items())
+                # Remise à zéro ici plutôt qu'au début du map : un pair rapide
+                # peut déjà nous avoir envoyé ses mots à ce moment-là.
+                self._incoming_counts = collections.Counter()
+                self._shard_counters = []
+                self._finished_peers = 0
             snapshot.sort()
             return snapshot, None
         except Exception as exc:  # pylint: disable=broad-except
             return None, str(exc)
 
-    # Itère sur les mots dans le fichier split.
-    def _iter_words(self, path: Path) -> Iterable[str]:
+    # Sérialise les paires (mot, count) en enregistrements RESULT_RECORD.
+    @staticmethod
+    def _encode_results(results: List[Tuple[str, int]]) -> bytearray:
+        blob = bytearray()
+        pack_record = RESULT_RECORD.pack
+        for word, count in results:
+            payload = word.encode("utf-8")
+            blob += pack_record(len(payload), count)
+            blob += payload
+        return blob
+
+    # Produit les comptes du split, en un seul Counter ou tranche par tranche.
+    def _iter_word_counts(self, path: Path) -> Iterator[collections.Counter]:
+        if self._map_processes == 1 and not self._ascii_words:
+            yield self._count_words(path)
+            return
+        for counts in self._iter_range_counts(path):
+            if self._ascii_words:
+                # Seules les clés distinctes sont décodées, pas chaque occurrence.
+                counts = collections.Counter(
+                    {word.decode("ascii"): count for word, count in counts.items()}
+                )
+            yield counts
+
+    # Compte les mots du fichier split.
+    def _count_words(self, path: Path) -> collections.Counter:
         # Extraction naïve des tokens alphanumériques pour le wordcount.
+        # Les lignes sont traitées par blocs : un seul lower() et un seul
+        # findall() par bloc au lieu d'un par ligne. Le comptage passe par
+        # Counter.update, si bien qu'aucun bytecode Python ne s'exécute par mot.
+        counts: collections.Counter = collections.Counter()
         with path.open("r", encoding=self.encoding) as handle:
-            max_lines = self.max_lines
-            lines_read = 0
-            for line in handle:
-                for raw_word in WORD_RE.findall(line.lower()):
-                    word = raw_word.strip()
-                    if word:
-                        yield word
-                if max_lines is not None:
-                    lines_read += 1
-                    if lines_read >= max_lines:
-                        break
-
-    # Fonction de hachage configurable pour répartir les mots entre workers.
-    def _hash_to_index(self, word: str) -> int:
-        encoded = word.encode(self.encoding)
-        if self._hash_name == "crc32":
-            value = zlib.crc32(encoded) & 0xFFFFFFFF
-        elif self._hash_name == "md5":
-            digest = hashlib.md5(encoded).digest()
-            value = int.from_bytes(digest, byteorder="big")
-        elif self._hash_name == "blake2s":
-            digest = hashlib.blake2s(encoded).digest()
-            value = int.from_bytes(digest, byteorder="big")
-        else:
-            raise ValueError(f"Unsupported hash function: {self._hash_name}")
-        return value % len(self.hosts)
+            lines: Iterable[str] = handle
+            if self.max_lines is not None:
+                lines = itertools.islice(handle, self.max_lines)
+            while True:
+                block = "".join(itertools.islice(lines, MAP_LINES_PER_BLOCK))
+                if not block:
+                    break
+                counts.update(WORD_RE.findall(block.lower()))
+        return counts
 
-    # Envoie un mot à un autre worker (ou à soi-même).
-    # Les transmissions réseau sont mises en tampon pour limiter les appels send().
-    def _send_word(self, destination: int, word: str) -> None:
-        if destination == self.machine_index:
-            with self._incoming_lock:
-                self._incoming_counts[word] += 1
+    # Lecture binaire du split par tranches d'octets : avec --map-processes, le
+    # split est découpé en tranches de lignes comptées chacune dans un
+    # processus, ce qui contourne le GIL. Chaque tranche est produite dès
+    # qu'elle est prête, pour que son shuffle chevauche le calcul des autres.
+    def _iter_range_counts(self, path: Path) -> Iterator[collections.Counter]:
+        ranges = self._split_ranges(path, self._map_processes)
+        if len(ranges) <= 1:
+            for start, end in ranges:
+                yield count_words_in_range(str(path), start, end, self.encoding, self._ascii_words)
+            return
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(
+                    count_words_in_range, str(path), start, end, self.encoding, self._ascii_words
+                )
+                for start, end in ranges
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    # Découpe le split en `parts` tranches d'octets alignées sur les fins de ligne.
+    def _split_ranges(self, path: Path, parts: int) -> List[Tuple[int, int]]:
+        with path.open("rb") as handle:
+            if self.max_lines is not None:
+                end = self._max_lines_offset(handle)
+            else:
+                end = os.fstat(handle.fileno()).st_size
+            boundaries = [0]
+            for part in range(1, parts):
+                handle.seek(end * part // parts)
+                handle.readline()
+                boundaries.append(min(handle.tell(), end))
+            boundaries.append(end)
+        return [(start, stop) for start, stop in zip(boundaries, boundaries[1:]) if stop > start]
+
+    # Position de fin de la ligne numéro max_lines (ou taille du fichier).
+    def _max_lines_offset(self, handle) -> int:
+        remaining = self.max_lines
+        offset = 0
+        while remaining > 0:
+            block = handle.read(MAP_BLOCK_SIZE)
+            if not block:
+                break
+            newlines = block.count(b"\n")
+            if newlines >= remaining:
+                index = -1
+                for _ in range(remaining):
+                    index = block.index(b"\n", index + 1)
+                return offset + index + 1
+            remaining -= newlines
+            offset += len(block)
+        return offset
+
+    # Fonction de hachage configurable pour répartir les mots entre workers,
+    # résolue une seule fois : elle prend directement le mot encodé.
+    @staticmethod
+    def _select_hash_function(hash_name: str) -> Callable[[bytes], int]:
+        if hash_name == "crc32":
+            return zlib.crc32
+        if hash_name == "xxh3":
+            if xxhash is None:
+                raise ValueError("--hash xxh3 requires the 'xxhash' package")
+            return xxhash.xxh3_64_intdigest
+        if hash_name == "md5":
+            return lambda data: int.from_bytes(hashlib.md5(data).digest(), byteorder="big")
+        if hash_name == "blake2s":
+            return lambda data: int.from_bytes(hashlib.blake2s(data).digest(), byteorder="big")
+        raise ValueError(f"Unsupported hash function: {hash_name}")
+
+    # Répartit les comptes combinés en une seule passe : un tampon par
+    # destination indexé par position, envoyé dès qu'il atteint le seuil.
+    # Les attributs sont copiés en variables locales pour alléger la boucle.
+    def _partition_counts(self, counts: collections.Counter) -> None:
+        num_hosts = len(self.hosts)
+        own_index = self.machine_index
+        self._connect_peers()
+        sockets = [self._outgoing_sockets.get(index) for index in range(num_hosts)]
+        buffers = [bytearray() for _ in range(num_hosts)]
+        local_counts = self._local_counts
+        encoding = self.encoding
+        hash_bytes = self._hash_bytes
+        pack_header = FRAME_HEADER.pack
+        threshold = self._flush_threshold
+        for word, count in counts.items():
+            payload = word.encode(encoding)
+            destination = hash_bytes(payload) % num_hosts
+            if destination == own_index:
+                local_counts[word] = local_counts.get(word, 0) + count
+                continue
+            buffer = buffers[destination]
+            buffer += pack_header(len(payload), count)
+            buffer += payload
+            if len(buffer) >= threshold:
+                sockets[destination].sendall(buffer)
+                buffer.clear()
+        for destination, buffer in enumerate(buffers):
+            if buffer:
+                sockets[destination].sendall(buffer)
+
+    # Signale la fin de la phase map à chaque autre worker, y compris ceux à qui
+    # aucun mot n'a été envoyé, pour qu'ils sachent quand leur shuffle est complet.
+    def _send_end_of_map(self) -> None:
+        for destination in range(len(self.hosts)):
+            if destination == self.machine_index:
+                continue
+            try:
+                sock = self._get_outgoing_socket(destination)
+                sock.sendall(END_OF_MAP_FRAME)
+                # Décorker pour pousser immédiatement le dernier segment partiel.
+                if hasattr(socket, "TCP_CORK"):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+            except OSError as exc:
+                print(
+                    f"[worker {self.worker_id}] Failed to notify end of map to "
+                    f"worker {destination + 1}: {exc}",
+                    file=sys.stderr,
+                )
+
+    # Ouvre en parallèle les connexions vers tous les autres workers, pour que
+    # les relances vers un pair lent ne retardent pas les autres.
+    def _connect_peers(self) -> None:
+        missing = [
+            index
+            for index in range(len(self.hosts))
+            if index != self.machine_index and index not in self._outgoing_sockets
+        ]
+        if not missing:
             return
-        sock = self._get_outgoing_socket(destination)
-        payload = word.encode(self.encoding)
-        header = struct.pack(">I", len(payload))
-        buffer = self._pending_frames.setdefault(destination, bytearray())
-        buffer.extend(header)
-        buffer.extend(payload)
-        if self._flush_threshold == 0 or len(buffer) >= self._flush_threshold:
-            self._flush_outgoing(destination)
+        first_error: Optional[OSError] = None
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            futures = {index: pool.submit(self._open_peer_connection, index) for index in missing}
+            for index, future in futures.items():
+                try:
+                    self._outgoing_sockets[index] = future.result()
+                except OSError as exc:
+                    if first_error is None:
+                        first_error = exc
+        if first_error is not None:
+            raise first_error
 
     # Obtient (ou crée) une connexion socket vers un autre worker.
     def _get_outgoing_socket(self, destination: int) -> socket.socket:
         sock = self._outgoing_sockets.get(destination)
-        if sock is not None:
-            return sock
+        if sock is None:
+            sock = self._open_peer_connection(destination)
+            self._outgoing_sockets[destination] = sock
+        return sock
+
+    # Se connecte au port shuffle d'un pair, avec des relances espacées
+    # exponentiellement (10 ms, 20 ms, 40 ms...) tant que le budget le permet.
+    def _open_peer_connection(self, destination: int) -> socket.socket:
         host = self.hosts[destination]
         port = self.shuffle_base_port + destination
-        for attempt in range(5):
+        deadline = time.monotonic() + CONNECT_RETRY_BUDGET
+        delay = CONNECT_RETRY_DELAY
+        while True:
             try:
                 sock = socket.create_connection((host, port), timeout=5.0)
                 break
             except OSError:
-                if attempt == 4:
+                if time.monotonic() + delay >= deadline:
                     raise
-                time.sleep(0.2)
+                time.sleep(delay)
+                delay *= 2
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-        self._outgoing_sockets[destination] = sock
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        # Linux uniquement : TCP_CORK regroupe les petits envois en segments
+        # pleins (utile avec un --flush-threshold faible), jusqu'au décorkage.
+        if hasattr(socket, "TCP_CORK"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
         return sock
 
-    def _flush_outgoing(self, destination: int) -> None:
-        buffer = self._pending_frames.get(destination)
-        if not buffer:
-            return
-        sock = self._outgoing_sockets.get(destination)
-        if sock is None:
-            sock = self._get_outgoing_socket(destination)
-        if not buffer:
-            return
-        try:
-            sock.sendall(buffer)
-        finally:
-            buffer.clear()
-
-    def _flush_all_outgoing(self) -> None:
-        for destination in list(self._pending_frames.keys()):
-            self._flush_outgoing(destination)
-
     # Ferme toutes les connexions sortantes.
     def _close_outgoing(self) -> None:
-        self._flush_all_outgoing()
-        for destination, sock in list(self._outgoing_sockets.items()):
+        for sock in self._outgoing_sockets.values():
             try:
                 sock.shutdown(socket.SHUT_RDWR)
             except OSError:
                 pass
             sock.close()
-            self._pending_frames.pop(destination, None)
         self._outgoing_sockets.clear()
 
-    # Consomme un flux de paires (mot, 1) en provenance d'un autre worker.
-    def _consume_shuffle_stream(self, conn: socket.socket) -> None:
-        with conn:
-            while not self._shutdown_event.is_set():
-                try:
-                    length_bytes = self._recv_exact(conn, 4)
-                    if not length_bytes:
-                        break
-                    size = struct.unpack(">I", length_bytes)[0]
-                    payload = self._recv_exact(conn, size)
-                    if not payload:
-                        break
-                except socket.timeout:
-                    if self._shutdown_event.is_set():
-                        break
-                    continue
-                word = payload.decode(self.encoding)
-                if not word:
-                    continue
-                with self._incoming_lock:
-                    self._incoming_counts[word] += 1
-
-    # Envoi de données avec un en-tête de taille
-    def _send_frame(self, sock: socket.socket, payload: bytes) -> None:
-        header = struct.pack(">I", len(payload))
-        sock.sendall(header + payload)
-
-    # Réception de données exactes
-    def _recv_exact(self, sock: socket.socket, size: int) -> Optional[bytes]:
-        data = b""
-        while len(data) < size:
-            chunk = sock.recv(size - len(data))
-            if not chunk:
+    # Lit ce qui est disponible sur une connexion prête puis découpe toutes les
+    # trames complètes du tampon, le reliquat étant ramené en tête.
+    # Renvoie True si le pair a signalé la fin de sa phase map, False s'il a
+    # fermé la connexion, None si le flux reste ouvert.
+    def _drain_shuffle_stream(
+        self, conn: socket.socket, stream: ShuffleStream
+    ) -> Optional[bool]:
+        header_size = FRAME_HEADER.size
+        if stream.filled == len(stream.buffer):
+            # Trame plus grande que le tampon : on double sa taille.
+            stream.view.release()
+            stream.buffer.extend(bytes(len(stream.buffer)))
+            stream.view = memoryview(stream.buffer)
+        try:
+            received = conn.recv_into(stream.view[stream.filled:])
+        except BlockingIOError:
+            return None
+        except OSError:
+            return False
+        if not received:
+            return False
+        # TCP_QUICKACK n'est pas persistant : le noyau repasse en ACK retardé
+        # après quelques segments, on le réarme donc après chaque lecture.
+        if hasattr(socket, "TCP_QUICKACK"):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        buffer = stream.buffer
+        counts = stream.counts
+        filled = stream.filled + received
+        offset = 0
+        while filled - offset >= header_size:
+            size, count = FRAME_HEADER.unpack_from(buffer, offset)
+            if size == 0 and count == 0:
+                return True
+            end = offset + header_size + size
+            if end > filled:
+                break
+            word = buffer[offset + header_size : end].decode(self.encoding)
+            if word:
+                counts[word] = counts.get(word, 0) + count
+            offset = end
+        if offset:
+            remaining = filled - offset
+            buffer[:remaining] = buffer[offset:filled]
+            filled = remaining
+        stream.filled = filled
+        return None
+
+    # Envoi de données avec un en-tête de taille, suivies d'un éventuel bloc
+    # binaire (`trailer`) hors du cadre préfixé.
+    def _send_frame(self, sock: socket.socket, payload: bytes, trailer: bytes = b"") -> None:
+        header = LENGTH_PREFIX.pack(len(payload))
+        if not hasattr(sock, "sendmsg"):
+            # Pas de sendmsg (Windows) : une seule écriture concaténée.
+            sock.sendall(b"".join((header, payload, trailer)))
+            return
+        # En-tête, message et bloc annexe partent dans le même appel système
+        # (scatter-gather), sans recopie pour les concaténer ; en cas d'envoi
+        # partiel, on reprend là où le noyau s'est arrêté.
+        views = [memoryview(part) for part in (header, payload, trailer) if part]
+        while views:
+            sent = sock.sendmsg(views)
+            while views and sent >= len(views[0]):
+                sent -= len(views[0])
+                views.pop(0)
+            if views and sent:
+                views[0] = views[0][sent:]
+
+    # Réception de données exactes, directement dans un tampon préalloué
+    # (recv_into évite les copies successives de `data += chunk`).
+    def _recv_exact(self, sock: socket.socket, size: int) -> Optional[bytearray]:
+        data = bytearray(size)
+        view = memoryview(data)
+        received = 0
+        while received < size:
+            count = sock.recv_into(view[received:])
+            if not count:
                 return None
-            data += chunk
+            received += count
         return data
 
     # Envoi des messages de contrôle au master
-    def _send_control(self, payload: Dict[str, object]) -> None:
+    def _send_control(self, payload: Dict[str, object], trailer: bytes = b"") -> None:
         assert self._master_socket is not None
-        data = json.dumps(payload).encode(self.encoding)
-        self._send_frame(self._master_socket, data)
+        # orjson produit directement des bytes UTF-8, sans passer par une str.
+        if orjson is not None:
+            data = orjson.dumps(payload)
+        else:
+            data = json.dumps(payload).encode(self.encoding)
+        self._send_frame(self._master_socket, data, trailer)
 
     # Réception des messages de contrôle du master
     def _recv_control(self) -> Optional[Dict[str, object]]:
         assert self._master_socket is not None
-        length_bytes = self._recv_exact(self._master_socket, 4)
+        length_bytes = self._recv_exact(self._master_socket, LENGTH_PREFIX.size)
         if not length_bytes:
             return None
-        size = struct.unpack(">I", length_bytes)[0]
+        size = LENGTH_PREFIX.unpack(length_bytes)[0]
         payload = self._recv_exact(self._master_socket, size)
         if not payload:
             return None
+        if orjson is not None:
+            return orjson.loads(payload)
         return json.loads(payload.decode(self.encoding))
 
 # Analyse des arguments de la ligne de commande
@@ -398,20 +749,40 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--hash",
         dest="hash_name",
-        choices=("crc32", "md5", "blake2s"),
+        choices=("crc32", "xxh3", "md5", "blake2s"),
         default="crc32",
         help=(
             "Hash algorithm used to partition words during shuffle "
-            "(crc32 is fastest, md5/blake2s trade speed for fewer collisions)"
+            "(crc32 and xxh3 are non-cryptographic and fast, xxh3 needs the xxhash "
+            "package; md5/blake2s are much slower and only kept for comparison)"
         ),
     )
     parser.add_argument(
         "--flush-threshold",
         dest="flush_threshold",
         type=int,
-        default=64 * 1024,
+        default=DEFAULT_FLUSH_THRESHOLD,
         help="Bytes to batch before flushing shuffle sockets (0 to flush immediately)",
     )
+    parser.add_argument(
+        "--map-processes",
+        dest="map_processes",
+        type=int,
+        default=1,
+        help=(
+            "Processes used to tokenize the split in parallel during the map stage "
+            "(the split encoding must be ASCII-compatible, e.g. utf-8)"
+        ),
+    )
+    parser.add_argument(
+        "--ascii-words",
+        dest="ascii_words",
+        action="store_true",
+        help=(
+            "Tokenize raw bytes with an ASCII [a-z0-9_]+ pattern instead of Unicode \\w+ "
+            "(faster, but accented letters split words)"
+        ),
+    )
     return parser.parse_args()
 
 
@@ -426,20 +797,22 @@ if __name__ == "__main__":
         sys.exit(1)
     machine_index = worker_id - 1
     split_id = args.split_id or str(worker_id)
-    client = MapReduceClient(
-        machine_index=machine_index,
-        worker_id=worker_id,
-        split_id=split_id,
-        hosts=hosts,
-        master_host=args.master_host,
-        control_port=args.control_port,
-        shuffle_port_base=args.shuffle_port_base,
-        encoding=args.encoding,
-        max_lines=args.max_lines,
-        hash_name=args.hash_name,
-        flush_threshold=args.flush_threshold,
-    )
     try:
+        client = MapReduceClient(
+            machine_index=machine_index,
+            worker_id=worker_id,
+            split_id=split_id,
+            hosts=hosts,
+            master_host=args.master_host,
+            control_port=args.control_port,
+            shuffle_port_base=args.shuffle_port_base,
+            encoding=args.encoding,
+            max_lines=args.max_lines,
+            hash_name=args.hash_name,
+            flush_threshold=args.flush_threshold,
+            map_processes=args.map_processes,
+            ascii_words=args.ascii_words,
+        )
         client.start()
     except Exception as exc:  # pylint: disable=broad-except
         print(f"Client terminated with error: {exc}", file=sys.stderr)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import argparse
-import collections
 import json
+import operator
+import selectors
 import socket
 import struct
-import threading
+import sys
 from typing import Dict, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # dépendance optionnelle : repli sur le module json standard
+    orjson = None
+
 """Master node orchestration for the MapReduce wordcount demo.
 
 Le master accepte les connexions de contrôle des workers, diffuse les
@@ -15,6 +21,26 @@ ordres de démarrage des phases map et reduce, agrège les résultats et
 assure un arrêt coordonné.
 """
 
+# Taille initiale (et taille à laquelle il revient) du tampon de réception
+# d'un worker.
+CLIENT_BUFFER_SIZE = 64 * 1024
+
+# Taille de lecture par défaut des sockets de contrôle, et bornes acceptées :
+# par défaut un recv_into remplit tout le tampon de réception d'un worker.
+DEFAULT_RECEIVE_CHUNK = 64 * 1024
+MIN_RECEIVE_CHUNK = 1024
+MAX_RECEIVE_CHUNK = 64 * 1024
+
+# Taille minimale de la file d'attente des connexions entrantes.
+MIN_LISTEN_BACKLOG = 128
+
+# Préfixe de taille des messages de contrôle (4 bytes big-endian).
+LENGTH_PREFIX = struct.Struct(">I")
+
+# Enregistrement binaire d'un résultat reduce : taille du mot (UTF-8) puis
+# nombre d'occurrences, suivis du mot.
+RESULT_RECORD = struct.Struct(">IQ")
+
 # Informations par client connecté.
 class ClientInfo:
     """Métadonnées par worker : socket, adresse et informations déclarées."""
@@ -22,245 +48,348 @@ class ClientInfo:
     def __init__(self, sock: socket.socket, addr: Tuple[str, int]) -> None:
         self.sock = sock
         self.addr = addr
-        self.lock = threading.Lock()
         self.machine_index: Optional[int] = None
         self.split_id: Optional[str] = None
         self.shuffle_port: Optional[int] = None
+        # Tampon de réception réutilisé : les octets non consommés sont entre
+        # read_pos et write_pos (message incomplet ou suivants).
+        self.buffer = bytearray(CLIENT_BUFFER_SIZE)
+        self.read_pos = 0
+        self.write_pos = 0
+        # Message `reduce_finished` en attente de ses résultats binaires.
+        self.pending_results: Optional[Dict[str, object]] = None
 
-# Lit exactement `size` octets depuis le socket, ou None si la connexion est fermée.
-def recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
-    data = b""
-    while len(data) < size:
-        chunk = sock.recv(size - len(data))
-        if not chunk:
-            return None
-        data += chunk
-    return data
+# Décode les résultats reduce envoyés en binaire à la suite de `reduce_finished`.
+def decode_results(blob: memoryview) -> Dict[str, int]:
+    results: Dict[str, int] = {}
+    header_size = RESULT_RECORD.size
+    offset = 0
+    while offset + header_size <= len(blob):
+        size, count = RESULT_RECORD.unpack_from(blob, offset)
+        offset += header_size
+        results[str(blob[offset : offset + size], "utf-8")] = count
+        offset += size
+    return results
 
-# Lit un message JSON préfixé par sa taille (4 bytes big-endian).
-def recv_json(sock: socket.socket) -> Optional[Dict[str, object]]:
-    length_bytes = recv_exact(sock, 4)
-    if not length_bytes:
-        return None
-    size = struct.unpack(">I", length_bytes)[0]
-    payload = recv_exact(sock, size)
-    if not payload:
+# Extrait du tampon du client le prochain message complet (JSON préfixé par sa
+# taille, suivi le cas échéant de ses résultats binaires), ou None s'il manque
+# encore des octets. Le message et ses résultats sont lus via des memoryview,
+# sans copie ; seul le curseur de lecture avance.
+def next_message(info: ClientInfo) -> Optional[Tuple[Dict[str, object], Optional[memoryview]]]:
+    buffer = info.buffer
+    if info.pending_results is None:
+        if info.write_pos - info.read_pos < LENGTH_PREFIX.size:
+            return None
+        size = LENGTH_PREFIX.unpack_from(buffer, info.read_pos)[0]
+        start = info.read_pos + LENGTH_PREFIX.size
+        end = start + size
+        if info.write_pos < end:
+            return None
+        payload = memoryview(buffer)[start:end]
+        # orjson lit directement les octets, sans décodage UTF-8 préalable.
+        if orjson is not None:
+            message = orjson.loads(payload)
+        else:
+            message = json.loads(str(payload, "utf-8"))
+        if not isinstance(message, dict):
+            raise ValueError("control message is not a JSON object")
+        info.read_pos = end
+        if not isinstance(message.get("results_size"), int):
+            return message, None
+        info.pending_results = message
+    results_size = info.pending_results["results_size"]
+    if info.write_pos - info.read_pos < results_size:
         return None
-    return json.loads(payload.decode("utf-8"))
+    message, info.pending_results = info.pending_results, None
+    blob = memoryview(buffer)[info.read_pos : info.read_pos + results_size]
+    info.read_pos += results_size
+    return message, blob
+
+# Prépare le tampon du client à recevoir `needed` octets après write_pos :
+# retour au début quand tout a été consommé, compaction sinon, agrandissement
+# en dernier recours (résultats reduce volumineux).
+def reserve_buffer(info: ClientInfo, needed: int) -> None:
+    buffer = info.buffer
+    if info.read_pos == info.write_pos:
+        info.read_pos = info.write_pos = 0
+        if len(buffer) > CLIENT_BUFFER_SIZE and needed <= CLIENT_BUFFER_SIZE:
+            del buffer[CLIENT_BUFFER_SIZE:]
+    if len(buffer) - info.write_pos >= needed:
+        return
+    unread = info.write_pos - info.read_pos
+    if info.read_pos:
+        buffer[:unread] = buffer[info.read_pos : info.write_pos]
+        info.read_pos, info.write_pos = 0, unread
+    if len(buffer) < unread + needed:
+        buffer.extend(bytes(unread + needed - len(buffer)))
+
+# Encode un message JSON et son préfixe de taille (4 bytes big-endian), gardés
+# séparés pour être envoyés sans concaténation.
+def encode_message(payload: Dict[str, object]) -> Tuple[bytes, bytes]:
+    if orjson is not None:
+        data = orjson.dumps(payload)
+    else:
+        data = json.dumps(payload).encode("utf-8")
+    return LENGTH_PREFIX.pack(len(data)), data
 
-# Envoie un message JSON préfixé par sa taille (4 bytes big-endian).
-def send_json(sock: socket.socket, payload: Dict[str, object]) -> None:
-    data = json.dumps(payload).encode("utf-8")
-    header = struct.pack(">I", len(data))
-    sock.sendall(header + data)
+# Envoie en-tête et message dans le même appel système (sendmsg/writev), en
+# reprenant là où le noyau s'est arrêté en cas d'envoi partiel.
+def send_frame(sock: socket.socket, parts: Tuple[bytes, bytes]) -> None:
+    if not hasattr(sock, "sendmsg"):
+        # Pas de sendmsg (Windows) : une seule écriture concaténée.
+        sock.sendall(b"".join(parts))
+        return
+    views = [memoryview(part) for part in parts if part]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if views and sent:
+            views[0] = views[0][sent:]
 
 # Serveur principal orchestrant les phases map/reduce.
 class MasterServer:
-    def __init__(self, host: str, port: int, expected_workers: int) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        expected_workers: int,
+        receive_chunk: int = DEFAULT_RECEIVE_CHUNK,
+        sndbuf: Optional[int] = None,
+        rcvbuf: Optional[int] = None,
+    ) -> None:
         self.host = host
         self.port = port
         self.expected_workers = expected_workers
+        self.receive_chunk = max(MIN_RECEIVE_CHUNK, min(MAX_RECEIVE_CHUNK, receive_chunk))
+        # Tampons noyau optionnels : sans valeur, l'autotuning de Linux est conservé.
+        self.sndbuf = sndbuf
+        self.rcvbuf = rcvbuf
 
-        self._server_socket: Optional[socket.socket] = None
-        self._stop_event = threading.Event()
+        self._selector = selectors.DefaultSelector()
+        self._stopped = False
         self._clients: Dict[int, ClientInfo] = {}
         self._map_finished: Dict[int, Dict[str, object]] = {}
         self._reduce_results: Dict[int, Dict[str, int]] = {}
-        self._condition = threading.Condition()
         self._start_map_sent = False
         self._start_reduce_sent = False
+        # Table d'aiguillage des messages de contrôle par type.
+        self._handlers = {
+            "register": self._on_register,
+            "map_finished": self._on_map_finished,
+            "reduce_finished": self._on_reduce_finished,
+        }
 
     # Démarre le serveur et gère la boucle principale.
     def start(self) -> None:
-        # Thread d'acceptation séparé pour ne pas bloquer la boucle principale.
-        accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
-        accept_thread.start()
-        try:
-            self._coordinate()
-        finally:
-            self._stop_event.set()
-            if self._server_socket is not None:
-                try:
-                    self._server_socket.close()
-                except OSError:
-                    pass
-            accept_thread.join(timeout=2.0)
-            self._close_all_clients()
-
-    # Boucle d'acceptation des connexions entrantes.
-    def _accept_loop(self) -> None:
+        # Un seul thread : la boucle événementielle accepte les workers, lit
+        # leurs messages et fait avancer les phases au fil des réceptions.
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_sock:
             server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Réglés avant listen() pour que les sockets acceptés en héritent
+            # (la fenêtre TCP initiale dépend de SO_RCVBUF à ce moment-là).
+            if self.sndbuf is not None:
+                server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+            if self.rcvbuf is not None:
+                server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
             server_sock.bind((self.host, self.port))
-            server_sock.listen()
-            self._server_socket = server_sock
-            while not self._stop_event.is_set():
-                try:
-                    conn, addr = server_sock.accept()
-                except OSError:
-                    break
-                info = ClientInfo(conn, addr)
-                threading.Thread(target=self._handle_client, args=(info,), daemon=True).start()
+            # File d'attente explicite : tous les workers se connectent au même
+            # instant au démarrage (le défaut de Python plafonne à 128).
+            server_sock.listen(max(MIN_LISTEN_BACKLOG, 2 * self.expected_workers))
+            self._selector.register(server_sock, selectors.EVENT_READ)
+            try:
+                while not self._stopped:
+                    for key, _ in self._selector.select():
+                        if key.data is None:
+                            self._accept_client(server_sock)
+                        else:
+                            self._read_client(key.data)
+                        if self._stopped:
+                            break
+            finally:
+                self._close_all_clients()
+                self._selector.close()
+
+    # Accepte un worker et enregistre sa socket dans la boucle.
+    def _accept_client(self, server_sock: socket.socket) -> None:
+        try:
+            conn, addr = server_sock.accept()
+        except OSError:
+            return
+        # Messages de contrôle petits et sensibles à la latence : pas de Nagle.
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        info = ClientInfo(conn, addr)
+        self._selector.register(conn, selectors.EVENT_READ, info)
 
-    # Gère la communication avec un client connecté.
-    def _handle_client(self, info: ClientInfo) -> None:
-        sock = info.sock
+    # Lit ce qui est disponible sur une socket prête puis traite tous les
+    # messages complets du tampon.
+    def _read_client(self, info: ClientInfo) -> None:
+        needed = self.receive_chunk
+        if info.pending_results is not None:
+            # Résultats reduce volumineux : lire d'un coup tout ce qui manque.
+            unread = info.write_pos - info.read_pos
+            needed = max(needed, int(info.pending_results["results_size"]) - unread)
+        reserve_buffer(info, needed)
         try:
-            while not self._stop_event.is_set():
-                message = recv_json(sock)
-                if message is None:
+            count = info.sock.recv_into(memoryview(info.buffer)[info.write_pos :], needed)
+        except OSError:
+            count = 0
+        if not count:
+            self._disconnect(info)
+            return
+        info.write_pos += count
+        while not self._stopped:
+            try:
+                entry = next_message(info)
+                if entry is None:
                     break
-                self._process_message(info, message)
-        finally:
-            sock.close()
-            with self._condition:
-                if info.machine_index is not None:
-                    self._clients.pop(info.machine_index, None)
-                self._condition.notify_all()
-
-    # Traite un message reçu d'un client.
-    def _process_message(self, info: ClientInfo, message: Dict[str, object]) -> None:
-        msg_type = message.get("type")
-        if msg_type == "register":
-            machine_index = int(message.get("machine_index"))
-            info.machine_index = machine_index
-            info.split_id = str(message.get("split_id"))
-            info.shuffle_port = int(message.get("shuffle_port"))
-            with self._condition:
-                existing = self._clients.get(machine_index)
-                if existing is not None and existing is not info:
-                    existing.sock.close()
-                self._clients[machine_index] = info
-                print(f"Worker {machine_index} registered from {info.addr}")
-                self._condition.notify_all()
-        elif msg_type == "map_finished":
-            machine_index = int(message.get("machine_index"))
-            success = bool(message.get("success", False))
-            error = message.get("error")
-            with self._condition:
-                self._map_finished[machine_index] = {"success": success, "error": error}
-                status = "ok" if success else f"failed: {error}"
-                print(f"Map from worker {machine_index}: {status}")
-                self._condition.notify_all()
-        elif msg_type == "reduce_finished":
-            machine_index = int(message.get("machine_index"))
-            success = bool(message.get("success", False))
-            error = message.get("error")
-            raw_results = message.get("results")
-            results_dict: Dict[str, int] = {}
-            if isinstance(raw_results, list):
-                for entry in raw_results:
-                    if isinstance(entry, list) and len(entry) == 2:
-                        word, count = entry
-                        if isinstance(word, str) and isinstance(count, int):
-                            results_dict[word] = count
-            with self._condition:
-                if success:
-                    self._reduce_results[machine_index] = results_dict
-                    print(f"Reduce from worker {machine_index}: ok ({len(results_dict)} keys)")
-                else:
-                    print(f"Reduce from worker {machine_index} failed: {error}")
-                    self._reduce_results[machine_index] = {}
-                self._condition.notify_all()
-        else:
-            print(f"Unknown message from {info.addr}: {message}")
+                message, blob = entry
+                self._process_message(info, message, blob)
+            except (KeyError, ValueError, TypeError) as exc:
+                # Message mal formé : on coupe ce worker sans arrêter la boucle.
+                print(f"Invalid message from {info.addr}: {exc}")
+                self._disconnect(info)
+                return
+            self._advance_phase()
 
-    # Boucle de coordination principale.
-    def _coordinate(self) -> None:
-        # Boucle principale : bloquée sur la condition tant que des événements
-        # (inscription, fin de map/reduce) ne sont pas reçus.
-        while not self._stop_event.is_set():
-            payload: Optional[Dict[str, object]] = None
-            clients_snapshot = []
-            post_action: Optional[str] = None
-            with self._condition:
-                if not self._start_map_sent and len(self._clients) >= self.expected_workers:
-                    clients_snapshot = list(self._clients.items())
-                    payload = {"type": "start_map"}
-                    self._start_map_sent = True
-                    post_action = "start_map"
-                elif (
-                    self._start_map_sent
-                    and not self._start_reduce_sent
-                    and len(self._map_finished) >= self.expected_workers
-                ):
-                    clients_snapshot = list(self._clients.items())
-                    payload = {"type": "start_reduce"}
-                    self._start_reduce_sent = True
-                    post_action = "start_reduce"
-                elif (
-                    self._start_reduce_sent
-                    and len(self._reduce_results) >= self.expected_workers
-                ):
-                    self._emit_final_result()
-                    clients_snapshot = list(self._clients.items())
-                    payload = {"type": "shutdown"}
-                    self._stop_event.set()
-                    post_action = "shutdown"
-                else:
-                    self._condition.wait()
-                    continue
-            if payload is not None:
-                self._broadcast(payload, clients_snapshot)
-                if post_action == "start_map":
-                    print("\nAll workers registered. start_map sent.")
-                elif post_action == "start_reduce":
-                    print("\nAll map_finished received. start_reduce sent.")
-                elif post_action == "shutdown":
-                    return
+    # Ferme la connexion d'un worker et l'oublie.
+    def _disconnect(self, info: ClientInfo) -> None:
+        try:
+            self._selector.unregister(info.sock)
+        except (KeyError, ValueError):
+            pass
+        try:
+            info.sock.close()
+        except OSError:
+            pass
+        if info.machine_index is not None and self._clients.get(info.machine_index) is info:
+            self._clients.pop(info.machine_index, None)
 
-    # Diffuse un message à tous les clients connectés.
-    def _broadcast(
+    # Traite un message reçu d'un client en l'aiguillant selon son type.
+    def _process_message(
         self,
-        payload: Dict[str, object],
-        clients_snapshot: Optional[list[Tuple[int, ClientInfo]]] = None,
+        info: ClientInfo,
+        message: Dict[str, object],
+        blob: Optional[memoryview] = None,
     ) -> None:
-        if clients_snapshot is None:
-            clients_snapshot = []
-        failed: list[Tuple[int, ClientInfo]] = []
-        for index, info in clients_snapshot:
-            try:
-                with info.lock:
-                    send_json(info.sock, payload)
-            except OSError:
-                print(f"Failed to send to worker {index}, closing connection")
-                failed.append((index, info))
-        if failed:
-            self._remove_failed_clients(failed)
+        handler = self._handlers.get(message.get("type"))
+        if handler is None:
+            print(f"Unknown message from {info.addr}: {message}")
+            return
+        handler(info, message, blob)
 
-    def _remove_failed_clients(self, failed: list[Tuple[int, ClientInfo]]) -> None:
-        for _, info in failed:
+    # Inscription d'un worker (remplace une éventuelle connexion précédente).
+    def _on_register(
+        self, info: ClientInfo, message: Dict[str, object], _blob: Optional[memoryview]
+    ) -> None:
+        machine_index = int(message["machine_index"])
+        info.machine_index = machine_index
+        info.split_id = str(message["split_id"])
+        info.shuffle_port = int(message["shuffle_port"])
+        existing = self._clients.get(machine_index)
+        if existing is not None and existing is not info:
+            self._disconnect(existing)
+        self._clients[machine_index] = info
+        print(f"Worker {machine_index} registered from {info.addr}")
+
+    # Fin de la phase map d'un worker.
+    def _on_map_finished(
+        self, _info: ClientInfo, message: Dict[str, object], _blob: Optional[memoryview]
+    ) -> None:
+        machine_index = int(message["machine_index"])
+        if machine_index in self._map_finished:
+            print(f"Duplicate map_finished from worker {machine_index} ignored")
+            return
+        success = bool(message.get("success", False))
+        error = message.get("error")
+        self._map_finished[machine_index] = {"success": success, "error": error}
+        status = "ok" if success else f"failed: {error}"
+        print(f"Map from worker {machine_index}: {status}")
+
+    # Fin de la phase reduce d'un worker, avec ses résultats partiels.
+    def _on_reduce_finished(
+        self, _info: ClientInfo, message: Dict[str, object], blob: Optional[memoryview]
+    ) -> None:
+        machine_index = int(message["machine_index"])
+        if machine_index in self._reduce_results:
+            # Renvoi d'un worker : ses résultats sont déjà comptés, inutile de
+            # décoder à nouveau un bloc potentiellement volumineux.
+            print(f"Duplicate reduce_finished from worker {machine_index} ignored")
+            return
+        if not message.get("success", False):
+            print(f"Reduce from worker {machine_index} failed: {message.get('error')}")
+            self._reduce_results[machine_index] = {}
+            return
+        raw_results = message.get("results")
+        results_dict: Dict[str, int] = {}
+        if blob is not None:
+            # Les résultats ont suivi le message sur la même socket.
+            results_dict = decode_results(blob)
+        elif isinstance(raw_results, dict):
+            results_dict = raw_results
+        elif isinstance(raw_results, list):
+            # Ancien format [[mot, compte], ...] : une entrée mal formée lève
+            # TypeError/ValueError et déconnecte le worker.
+            results_dict = dict(raw_results)
+        self._reduce_results[machine_index] = results_dict
+        print(f"Reduce from worker {machine_index}: ok ({len(results_dict)} keys)")
+
+    # Fait avancer le job d'une phase quand tous les workers ont répondu.
+    # Appelée après chaque message : tout l'état vit dans le thread de la boucle.
+    def _advance_phase(self) -> None:
+        if not self._start_map_sent and len(self._clients) >= self.expected_workers:
+            self._start_map_sent = True
+            self._broadcast({"type": "start_map"})
+            print("\nAll workers registered. start_map sent.")
+        elif (
+            self._start_map_sent
+            and not self._start_reduce_sent
+            and len(self._map_finished) >= self.expected_workers
+        ):
+            self._start_reduce_sent = True
+            self._broadcast({"type": "start_reduce"})
+            print("\nAll map_finished received. start_reduce sent.")
+        elif (
+            self._start_reduce_sent
+            and len(self._reduce_results) >= self.expected_workers
+        ):
+            self._emit_final_result()
+            self._broadcast({"type": "shutdown"})
+            self._stopped = True
+
+    # Diffuse un message à tous les clients connectés.
+    def _broadcast(self, payload: Dict[str, object]) -> None:
+        # Encodé une seule fois : la même trame part vers chaque worker.
+        frame = encode_message(payload)
+        for index, info in list(self._clients.items()):
             try:
-                info.sock.close()
+                send_frame(info.sock, frame)
             except OSError:
-                pass
-        with self._condition:
-            modified = False
-            for index, info in failed:
-                existing = self._clients.get(index)
-                if existing is info:
-                    self._clients.pop(index, None)
-                    modified = True
-            if modified:
-                self._condition.notify_all()
+                print(f"Failed to send to worker {index}, closing connection")
+                self._disconnect(info)
 
     # Agrège et affiche les résultats finaux du wordcount.
     def _emit_final_result(self) -> None:
-        final_counts = collections.Counter()
+        final_counts: Dict[str, int] = {}
         for partial in self._reduce_results.values():
-            for word, count in partial.items():
-                final_counts[word] += count
+            if final_counts.keys().isdisjoint(partial):
+                # Cas normal : chaque mot appartient à un seul reducer, la fusion
+                # est une simple copie de dictionnaire (en C).
+                final_counts.update(partial)
+            else:
+                for word, count in partial.items():
+                    final_counts[word] = final_counts.get(word, 0) + count
+        ordered = sorted(final_counts.items(), key=operator.itemgetter(1), reverse=True)
         print("\nFinal wordcount:")
-        for word, count in final_counts.most_common():
-            print(f"{word}: {count}")
+        # Une seule écriture pour tout le comptage plutôt qu'un print par mot.
+        sys.stdout.write("".join(f"{word}: {count}\n" for word, count in ordered))
 
     # Ferme toutes les connexions clients.
     def _close_all_clients(self) -> None:
-        for info in list(self._clients.values()):
-            try:
-                info.sock.close()
-            except OSError:
-                pass
+        for key in list(self._selector.get_map().values()):
+            if key.data is not None:
+                self._disconnect(key.data)
         self._clients.clear()
 
 # Analyse les arguments de la ligne de commande.
@@ -274,10 +403,37 @@ def parse_args() -> argparse.Namespace:
         required=True,
         help="Number of expected worker connections",
     )
+    parser.add_argument(
+        "--receive-chunk",
+        type=int,
+        default=DEFAULT_RECEIVE_CHUNK,
+        help=(
+            "Bytes requested per recv_into() on worker control sockets "
+            f"(default: %(default)s, clamped to {MIN_RECEIVE_CHUNK}..{MAX_RECEIVE_CHUNK}, "
+            "the size of the per-worker receive buffer)"
+        ),
+    )
+    parser.add_argument(
+        "--sndbuf",
+        type=int,
+        help="SO_SNDBUF for worker control sockets (default: kernel autotuning)",
+    )
+    parser.add_argument(
+        "--rcvbuf",
+        type=int,
+        help="SO_RCVBUF for worker control sockets (default: kernel autotuning)",
+    )
     return parser.parse_args()
 
 ### Point d'entrée principal. ###
 if __name__ == "__main__":
     args = parse_args()
-    server = MasterServer(host=args.host, port=args.port, expected_workers=args.num_workers)
+    server = MasterServer(
+        host=args.host,
+        port=args.port,
+        expected_workers=args.num_workers,
+        receive_chunk=args.receive_chunk,
+        sndbuf=args.sndbuf,
+        rcvbuf=args.rcvbuf,
+    )
     server.start()